@@ -59,7 +59,17 @@ function App() {
     setCurrentStep('Initializing...');
 
     try {
-      const response = await axios.post('/api/summarize', { url: targetUrl });
+      // Submit the job, then poll until the background worker finishes
+      const submitResponse = await axios.post('/api/summarize', { url: targetUrl });
+      const jobId = submitResponse.data.job_id;
+      setCurrentStep('Processing...');
+
+      let response = submitResponse;
+      while (response.data.status !== 'completed') {
+        await new Promise((resolve) => setTimeout(resolve, 2000));
+        response = await axios.get(`/api/summarize/${jobId}`);
+      }
+
       setResult(response.data);
       setCurrentStep('Complete!');
     } catch (err) {
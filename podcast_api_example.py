@@ -16,16 +16,29 @@ Usage:
     python podcast_api_example.py --engine whisper
 """
 import argparse
+import functools
+import hashlib
+import io
 import json
 import os
 import pathlib
-import xml.etree.ElementTree as ET
+import random
+import re
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from email.utils import parsedate_to_datetime
 from typing import List, Optional
 
+import orjson
 import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # NYT The Daily RSS Feed
 THE_DAILY_RSS = "https://feeds.simplecast.com/Sl5CSM3S"
@@ -33,6 +46,75 @@ THE_DAILY_RSS = "https://feeds.simplecast.com/Sl5CSM3S"
 # iTunes podcast namespace
 ITUNES_NS = {"itunes": "http://www.itunes.com/dtds/podcast-1.0.dtd"}
 
+# Download tuning knobs: copy in 1MiB blocks straight off the socket, and keep
+# a large write buffer so write() syscalls stay rare for multi-hundred-MB episodes.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Shared session so parallel episode downloads reuse connections and amortize
+# TLS handshakes; transient CDN errors get retried with backoff.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=1.0, status_forcelist=[502, 503, 504]),
+    ),
+)
+
+# Gemini File API upload cache: avoids re-uploading the same audio on retries
+# and re-runs. The File API keeps uploads ~48h; expire a bit early for safety.
+_UPLOAD_CACHE_FILE = ".gemini_upload_cache.json"
+_UPLOAD_CACHE_LOCK = threading.Lock()
+_UPLOAD_CACHE_TTL = 47 * 3600
+
+# Models to try in order (fallback on rate limits)
+GEMINI_MODELS = ["gemini-2.0-flash", "gemini-1.5-flash", "gemini-1.5-pro"]
+
+# Episodes longer than this get split into segments and transcribed in parallel,
+# keeping each request well under Gemini's context limit for audio.
+CHUNK_THRESHOLD_SECONDS = 3600
+CHUNK_SEGMENT_SECONDS = 600
+
+# Gemini embeds the server-suggested wait in 429 payloads, e.g. "retryDelay": "7s"
+_RETRY_DELAY_RE = re.compile(r'"retryDelay":\s*"(\d+(?:\.\d+)?)s"')
+
+
+def _gemini_retry_wait(error: Exception, attempt: int) -> float:
+    """
+    Wait time before retrying a rate-limited Gemini call.
+
+    Prefers the server's retryDelay hint, falling back to exponential
+    backoff, plus full jitter so parallel workers don't retry in lockstep.
+    """
+    m = _RETRY_DELAY_RE.search(str(error))
+    base = float(m.group(1)) if m else 5.0 * (2 ** attempt)
+    return min(max(base, 1.0), 120.0) + random.uniform(0, 5)
+
+
+# One Gemini client shared by all worker threads (created on first use)
+_GEMINI_CLIENT = None
+_GEMINI_CLIENT_LOCK = threading.Lock()
+
+
+def _get_gemini_client():
+    """Lazily create a single shared Gemini client (thread-safe)."""
+    global _GEMINI_CLIENT
+    if _GEMINI_CLIENT is None:
+        with _GEMINI_CLIENT_LOCK:
+            if _GEMINI_CLIENT is None:
+                from google import genai
+
+                api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+                if not api_key:
+                    raise EnvironmentError(
+                        "GOOGLE_API_KEY or GEMINI_API_KEY environment variable required. "
+                        "Get one at https://aistudio.google.com/apikey"
+                    )
+                _GEMINI_CLIENT = genai.Client(api_key=api_key)
+    return _GEMINI_CLIENT
+
 
 @dataclass
 class Episode:
@@ -45,11 +127,24 @@ class Episode:
     guid: Optional[str] = None
 
 
-def fetch_rss_feed(feed_url: str) -> ET.Element:
-    """Fetch and parse RSS feed XML."""
-    resp = requests.get(feed_url, timeout=30)
-    resp.raise_for_status()
-    return ET.fromstring(resp.content)
+def fetch_rss_feed(feed_url: str, count: Optional[int] = None):
+    """
+    Stream RSS <item> elements from a feed without building the full tree.
+
+    Yields lxml elements as they finish parsing and stops after `count` items,
+    so fetching the latest episode doesn't parse (or even download) the rest
+    of a long feed.
+    """
+    with _SESSION.get(feed_url, stream=True, timeout=30) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        seen = 0
+        for _event, item in etree.iterparse(resp.raw, events=("end",), tag="item"):
+            yield item
+            item.clear()  # Free the subtree once the caller has consumed it
+            seen += 1
+            if count is not None and seen >= count:
+                break
 
 
 def parse_rss_date(date_str: str) -> datetime:
@@ -60,7 +155,7 @@ def parse_rss_date(date_str: str) -> datetime:
         return datetime.now()
 
 
-def parse_episode(item: ET.Element) -> Optional[Episode]:
+def parse_episode(item: etree._Element) -> Optional[Episode]:
     """Parse an RSS <item> element into an Episode."""
     title = item.findtext("title", "Untitled")
 
@@ -91,67 +186,167 @@ def parse_episode(item: ET.Element) -> Optional[Episode]:
 
 def get_episodes(feed_url: str, count: int = 1) -> List[Episode]:
     """Fetch the most recent episodes from an RSS feed."""
-    root = fetch_rss_feed(feed_url)
-    channel = root.find("channel")
-    if channel is None:
-        raise ValueError("Invalid RSS feed: no channel element")
-
-    items = channel.findall("item")[:count]
     episodes = []
-    for item in items:
+    for item in fetch_rss_feed(feed_url, count=count):
         ep = parse_episode(item)
         if ep:
             episodes.append(ep)
     return episodes
 
 
-def download_file(url: str, out_path: pathlib.Path) -> pathlib.Path:
-    """Download a file with streaming to handle large podcast files."""
+def download_file(
+    url: str, out_path: pathlib.Path, total_size: Optional[int] = None
+) -> pathlib.Path:
+    """
+    Download a file with streaming to handle large podcast files.
+
+    If a previous run left a partial (or complete) file behind, skips the
+    download when the size already matches and resumes with a Range request
+    when it's smaller.
+    """
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with requests.get(url, stream=True, timeout=120) as r:
+
+    if total_size is None:
+        try:
+            head = _SESSION.head(url, allow_redirects=True, timeout=30)
+            head.raise_for_status()
+            total_size = int(head.headers.get("Content-Length") or 0)
+        except requests.RequestException:
+            total_size = 0
+
+    headers = {}
+    mode = "wb"
+    existing = out_path.stat().st_size if out_path.exists() else 0
+    if existing and total_size:
+        if existing == total_size:
+            return out_path  # Already fully downloaded by an earlier run
+        if existing < total_size:
+            headers["Range"] = f"bytes={existing}-"
+            mode = "ab"
+
+    with _SESSION.get(url, stream=True, timeout=120, headers=headers) as r:
         r.raise_for_status()
-        with open(out_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    f.write(chunk)
+        if headers and r.status_code != 206:
+            mode = "wb"  # Server ignored the Range; restart from scratch
+        # Unbuffered file + big BufferedWriter = one write() syscall per 8MB
+        with open(out_path, mode, buffering=0) as raw, \
+                io.BufferedWriter(raw, buffer_size=WRITE_BUFFER_SIZE) as f:
+            # Copy straight from the urllib3 response in a single C-level loop
+            # instead of the per-chunk iter_content generator.
+            r.raw.decode_content = True
+            shutil.copyfileobj(r.raw, f, length=DOWNLOAD_CHUNK_SIZE)
     return out_path
 
 
-def transcribe_with_gemini(audio_path: pathlib.Path) -> str:
+def download_file_ranged(
+    url: str,
+    out_path: pathlib.Path,
+    parts: int = 4,
+    part_size: int = 8 * 1024 * 1024,
+) -> pathlib.Path:
     """
-    Transcribe audio using Google Gemini API.
+    Download a file with parallel HTTP Range requests.
 
-    Uses File API for files > 20MB (typical for podcasts).
-    Requires GOOGLE_API_KEY environment variable.
+    A single TCP stream is usually RTT/window-limited, so large MP3s download
+    faster split into byte ranges fetched concurrently. Falls back to plain
+    streaming when the server doesn't advertise byte-range support.
     """
-    import time
-    from google import genai
-    from google.genai import types
-    from google.genai.errors import ClientError
-
-    api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        raise EnvironmentError(
-            "GOOGLE_API_KEY or GEMINI_API_KEY environment variable required. "
-            "Get one at https://aistudio.google.com/apikey"
-        )
+    out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    client = genai.Client(api_key=api_key)
+    try:
+        head = _SESSION.head(url, allow_redirects=True, timeout=30)
+        head.raise_for_status()
+    except requests.RequestException:
+        return download_file(url, out_path)
+
+    total = int(head.headers.get("Content-Length") or 0)
+    if out_path.exists() and total and out_path.stat().st_size == total:
+        return out_path  # Already fully downloaded by an earlier run
+    if head.headers.get("Accept-Ranges", "").lower() != "bytes" or total < part_size:
+        return download_file(url, out_path, total_size=total)
+
+    # Use the post-redirect URL so each range request skips the redirect hop
+    final_url = head.url
+
+    def fetch_part(fd: int, lo: int, hi: int) -> None:
+        with _SESSION.get(
+            final_url, headers={"Range": f"bytes={lo}-{hi}"}, stream=True, timeout=120
+        ) as r:
+            r.raise_for_status()
+            offset = lo
+            while True:
+                buf = r.raw.read(DOWNLOAD_CHUNK_SIZE)
+                if not buf:
+                    break
+                os.pwrite(fd, buf, offset)
+                offset += len(buf)
+
+    with open(out_path, "wb") as f:
+        f.truncate(total)  # Preallocate so parts can pwrite into their slots
+        fd = f.fileno()
+        ranges = [(lo, min(lo + part_size, total) - 1) for lo in range(0, total, part_size)]
+        with ThreadPoolExecutor(max_workers=parts) as pool:
+            futures = [pool.submit(fetch_part, fd, lo, hi) for lo, hi in ranges]
+            for future in as_completed(futures):
+                future.result()
 
-    file_size = audio_path.stat().st_size
-    file_size_mb = file_size / (1024 * 1024)
+    return out_path
+
+
+def _hash_file(path: pathlib.Path) -> str:
+    """Hash a file's contents with streaming 64KiB reads."""
+    h = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(64 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
 
-    # Determine MIME type from extension
-    suffix = audio_path.suffix.lower()
-    mime_types = {
-        ".mp3": "audio/mp3",
-        ".wav": "audio/wav",
-        ".m4a": "audio/mp4",
-        ".aac": "audio/aac",
-        ".ogg": "audio/ogg",
-        ".flac": "audio/flac",
-    }
-    mime_type = mime_types.get(suffix, "audio/mpeg")
+
+def _get_cached_upload(client, cache_path: pathlib.Path, digest: str):
+    """Return a still-valid Gemini file handle for this digest, or None."""
+    with _UPLOAD_CACHE_LOCK:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        entry = cache.get(digest)
+    if not entry or entry.get("expires", 0) < time.time():
+        return None
+    try:
+        # Validate the handle still exists server-side before reusing it
+        return client.files.get(name=entry["name"])
+    except Exception:
+        return None
+
+
+def _store_cached_upload(cache_path: pathlib.Path, digest: str, name: str) -> None:
+    with _UPLOAD_CACHE_LOCK:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        cache[digest] = {"name": name, "expires": time.time() + _UPLOAD_CACHE_TTL}
+        try:
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            print(f"  Warning: failed to write upload cache: {e}")
+
+
+def transcribe_with_gemini(audio_path: pathlib.Path, use_cache: bool = True) -> str:
+    """
+    Transcribe audio using Google Gemini API.
+
+    Always uploads via the File API so the audio streams from disk instead of
+    being read into memory. Uploads are cached across retries and re-runs so
+    the same episode isn't re-uploaded.
+    Requires GOOGLE_API_KEY environment variable.
+    """
+    from google.genai.errors import ClientError, ServerError
+
+    client = _get_gemini_client()
 
     prompt = (
         "Transcribe this audio completely and accurately. "
@@ -159,38 +354,25 @@ def transcribe_with_gemini(audio_path: pathlib.Path) -> str:
         "Preserve natural paragraph breaks where appropriate."
     )
 
-    # Models to try in order (fallback on rate limits)
-    models = ["gemini-2.0-flash", "gemini-1.5-flash", "gemini-1.5-pro"]
+    models = GEMINI_MODELS
 
-    uploaded_file = None
-    if file_size_mb > 20:
-        print(f"  Uploading {file_size_mb:.1f}MB to Gemini File API...")
-        uploaded_file = client.files.upload(file=str(audio_path))
+    # Always go through the File API: the upload streams from disk, avoiding
+    # an in-memory copy of the whole MP3 for the inline-bytes path.
+    uploaded_file = _upload_for_transcription(client, audio_path, use_cache)
 
     last_error = None
     for model in models:
         for attempt in range(3):  # Retry up to 3 times per model
             try:
-                if uploaded_file:
-                    print(f"  Transcribing with {model} (this may take a few minutes)...")
-                    response = client.models.generate_content(
-                        model=model,
-                        contents=[prompt, uploaded_file],
-                    )
-                else:
-                    with open(audio_path, "rb") as f:
-                        audio_bytes = f.read()
-                    print(f"  Transcribing with {model}...")
-                    response = client.models.generate_content(
-                        model=model,
-                        contents=[
-                            prompt,
-                            types.Part.from_bytes(data=audio_bytes, mime_type=mime_type),
-                        ],
-                    )
-
-                # Clean up uploaded file on success
-                if uploaded_file:
+                print(f"  Transcribing with {model} (this may take a few minutes)...")
+                response = client.models.generate_content(
+                    model=model,
+                    contents=[prompt, uploaded_file],
+                )
+
+                # Only delete the upload when caching is off; otherwise keep
+                # the handle alive for retries and re-runs (expires in ~48h).
+                if uploaded_file and not use_cache:
                     try:
                         client.files.delete(name=uploaded_file.name)
                     except Exception:
@@ -201,17 +383,23 @@ def transcribe_with_gemini(audio_path: pathlib.Path) -> str:
             except ClientError as e:
                 last_error = e
                 if "429" in str(e) or "RESOURCE_EXHAUSTED" in str(e):
-                    # Extract retry delay from error if available
-                    wait_time = 40 * (attempt + 1)  # 40s, 80s, 120s
-                    print(f"  Rate limited. Waiting {wait_time}s before retry...")
+                    # Honor the server's retryDelay hint instead of a fixed wait
+                    wait_time = _gemini_retry_wait(e, attempt)
+                    print(f"  Rate limited. Waiting {wait_time:.1f}s before retry...")
                     time.sleep(wait_time)
                 else:
                     raise  # Re-raise non-rate-limit errors
+            except ServerError as e:
+                # Transient 500/503s only need a short retry
+                last_error = e
+                wait_time = 2 * (attempt + 1) + random.uniform(0, 2)
+                print(f"  Server error. Waiting {wait_time:.1f}s before retry...")
+                time.sleep(wait_time)
 
         print(f"  Model {model} exhausted, trying next...")
 
     # Clean up on failure
-    if uploaded_file:
+    if uploaded_file and not use_cache:
         try:
             client.files.delete(name=uploaded_file.name)
         except Exception:
@@ -220,17 +408,172 @@ def transcribe_with_gemini(audio_path: pathlib.Path) -> str:
     raise last_error or RuntimeError("All Gemini models failed")
 
 
-def transcribe_with_faster_whisper(audio_path: pathlib.Path) -> str:
+def _upload_for_transcription(client, audio_path: pathlib.Path, use_cache: bool):
+    """Upload one audio file to the File API, reusing the cache when possible."""
+    cache_path = audio_path.parent / _UPLOAD_CACHE_FILE
+    digest = _hash_file(audio_path)
+    uploaded = _get_cached_upload(client, cache_path, digest) if use_cache else None
+    if uploaded:
+        print(f"  Reusing cached Gemini upload for {audio_path.name}")
+        return uploaded
+    print(f"  Uploading {audio_path.name} to Gemini File API...")
+    uploaded = client.files.upload(file=str(audio_path))
+    if use_cache:
+        _store_cached_upload(cache_path, digest, uploaded.name)
+    return uploaded
+
+
+def transcribe_batch_with_gemini(
+    audio_paths: List[pathlib.Path], use_cache: bool = True
+) -> List[str]:
+    """
+    Transcribe several episodes in a single Gemini request.
+
+    Batching N episodes into one generate_content call spends one request
+    instead of N, which matters when runs are limited by requests-per-minute
+    rather than tokens. Falls back to per-episode calls if the batched
+    response can't be parsed.
+    """
+    client = _get_gemini_client()
+
+    uploads = [_upload_for_transcription(client, path, use_cache) for path in audio_paths]
+
+    prompt = (
+        "Transcribe each of the following audio episodes completely and accurately. "
+        'Return ONLY a JSON object mapping the episode number (as a string, e.g. "1") '
+        "to its full transcript text, with no timestamps, speaker labels, or annotations."
+    )
+    contents: list = [prompt]
+    for i, uploaded in enumerate(uploads, 1):
+        contents.append(f"Episode {i}:")
+        contents.append(uploaded)
+
+    try:
+        print(f"  Transcribing {len(uploads)} episode(s) in one batched request...")
+        response = client.models.generate_content(model=GEMINI_MODELS[0], contents=contents)
+        text = response.text.strip()
+        # Tolerate code fences or prose around the JSON object
+        parsed = json.loads(text[text.find("{"):text.rfind("}") + 1])
+        return [str(parsed[str(i)]).strip() for i in range(1, len(uploads) + 1)]
+    except Exception as e:
+        print(f"  Batched transcription failed ({e}), falling back to per-episode calls...")
+        return [transcribe_with_gemini(path, use_cache=use_cache) for path in audio_paths]
+
+
+def _probe_duration_seconds(audio_path: pathlib.Path) -> float:
+    """Get audio duration via ffprobe. Returns 0.0 if ffprobe is unavailable."""
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(audio_path),
+            ],
+            capture_output=True, text=True, timeout=60,
+        )
+        return float(result.stdout.strip())
+    except Exception:
+        return 0.0
+
+
+def _cut_audio_segment(
+    audio_path: pathlib.Path, offset: int, length: int, chunk_path: pathlib.Path
+) -> bool:
+    """Cut a segment with ffmpeg's container-level copy (no re-encode)."""
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg", "-y",
+                "-ss", str(offset),
+                "-i", str(audio_path),
+                "-t", str(length),
+                "-c", "copy",
+                str(chunk_path),
+            ],
+            capture_output=True, timeout=300,
+        )
+        return result.returncode == 0 and chunk_path.exists()
+    except Exception:
+        return False
+
+
+def transcribe_chunked_with_gemini(
+    audio_path: pathlib.Path,
+    use_cache: bool = True,
+    gate: Optional[threading.Semaphore] = None,
+) -> str:
+    """
+    Transcribe audio, splitting multi-hour episodes into 10-minute segments.
+
+    Long podcasts can exceed Gemini's audio context and get truncated; cutting
+    segments with `ffmpeg -c copy` is near-instant, and the segments transcribe
+    in parallel. Short episodes (or missing ffmpeg) use the single-request path.
+    The gate (when given) is acquired around each individual Gemini request,
+    so segment fan-out can't multiply the caller's concurrency bound.
+    """
+    def _transcribe_gated(path: pathlib.Path) -> str:
+        if gate is not None:
+            with gate:
+                return transcribe_with_gemini(path, use_cache=use_cache)
+        return transcribe_with_gemini(path, use_cache=use_cache)
+
+    duration = _probe_duration_seconds(audio_path)
+    if duration <= CHUNK_THRESHOLD_SECONDS:
+        return _transcribe_gated(audio_path)
+
+    chunk_paths = []
+    for idx, offset in enumerate(range(0, int(duration), CHUNK_SEGMENT_SECONDS)):
+        chunk_path = audio_path.with_name(
+            f"{audio_path.stem}.part{idx:03d}{audio_path.suffix}"
+        )
+        if not _cut_audio_segment(audio_path, offset, CHUNK_SEGMENT_SECONDS, chunk_path):
+            print("  ffmpeg segmenting failed, transcribing in one request...")
+            for p in chunk_paths:
+                p.unlink(missing_ok=True)
+            return _transcribe_gated(audio_path)
+        chunk_paths.append(chunk_path)
+
+    print(f"  Transcribing {len(chunk_paths)} segments in parallel...")
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            # pool.map preserves segment order in its results
+            texts = list(pool.map(_transcribe_gated, chunk_paths))
+        return "\n".join(texts)
+    finally:
+        for p in chunk_paths:
+            p.unlink(missing_ok=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_whisper_model(model_size: str, device: str, compute_type: str):
+    """Load the Whisper model once per process; batch runs reuse it."""
+    from faster_whisper import WhisperModel
+
+    print(f"  Loading Whisper model '{model_size}' ({device}, {compute_type})...")
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+def transcribe_with_faster_whisper(
+    audio_path: pathlib.Path, model_size: str = "base", device: str = "auto"
+) -> str:
     """
     Transcribe audio using local faster-whisper model.
 
-    Runs offline, no API key needed.
+    Runs offline, no API key needed. Picks CUDA with float16 when a GPU is
+    available, int8 on CPU.
     Requires: pip install faster-whisper
     """
-    from faster_whisper import WhisperModel
+    if device == "auto":
+        try:
+            import torch
+
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        except ImportError:
+            device = "cpu"
+    compute_type = "float16" if device == "cuda" else "int8"
 
-    print("  Loading Whisper model...")
-    model = WhisperModel("base", device="cpu", compute_type="int8")
+    model = _get_whisper_model(model_size, device, compute_type)
 
     print("  Transcribing (this may take a while)...")
     segments, _info = model.transcribe(str(audio_path))
@@ -238,13 +581,93 @@ def transcribe_with_faster_whisper(audio_path: pathlib.Path) -> str:
     return "".join(text_parts).strip()
 
 
+class _SafeFilenameTable(dict):
+    """Lazily-built str.translate table: keeps alnum/space/_/-, deletes the rest."""
+
+    def __missing__(self, code: int):
+        ch = chr(code)
+        result = ch if (ch.isalnum() or ch in " _-") else None
+        self[code] = result
+        return result
+
+
+_SAFE_FILENAME_TABLE = _SafeFilenameTable()
+
+
 def make_safe_filename(title: str, max_length: int = 80) -> str:
     """Convert a title to a safe filename."""
-    safe = "".join(c for c in title if c.isalnum() or c in (" ", "_", "-"))
-    safe = safe.strip().replace(" ", "_")
+    # str.translate runs the filtering loop in C; the table memoizes per codepoint
+    safe = title.translate(_SAFE_FILENAME_TABLE).strip().replace(" ", "_")
     return safe[:max_length]
 
 
+def _write_episode_json(
+    episode: Episode, transcript: str, engine: str, output_file: pathlib.Path
+) -> None:
+    """Write the transcript plus episode metadata to a JSON file."""
+    meta = {
+        "title": episode.title,
+        "source": "NYT The Daily",
+        "feed_url": THE_DAILY_RSS,
+        "pub_date": episode.pub_date.isoformat(),
+        "duration": episode.duration,
+        "audio_url": episode.audio_url,
+        "transcription_engine": engine,
+        "transcript": transcript,
+    }
+    # orjson's C encoder is much faster than stdlib json on MB-sized transcripts
+    with open(output_file, "wb") as f:
+        f.write(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+
+
+def process_episode(
+    episode: Episode,
+    index: int,
+    total: int,
+    args: argparse.Namespace,
+    out_dir: pathlib.Path,
+    transcribe_gate: threading.Semaphore,
+) -> str:
+    """Download, transcribe, and save a single episode. Returns a status line."""
+    tag = f"[{index}/{total}] {episode.title}"
+
+    safe_name = make_safe_filename(episode.title)
+    audio_path = out_dir / f"{safe_name}.mp3"
+    output_file = out_dir / f"{safe_name}.json"
+
+    # Skip if already processed
+    if output_file.exists():
+        return f"{tag}: already processed, skipping"
+
+    # Download audio
+    print(f"{tag}: downloading audio...")
+    download_file_ranged(episode.audio_url, audio_path)
+    file_size_mb = audio_path.stat().st_size / (1024 * 1024)
+    print(f"{tag}: downloaded {file_size_mb:.1f}MB")
+
+    # Transcribe (gated so concurrent episodes respect Gemini rate limits).
+    # For Gemini the gate is taken per request inside the chunked path, so a
+    # long episode's segment fan-out still counts against --concurrency.
+    if args.engine == "gemini":
+        transcript = transcribe_chunked_with_gemini(
+            audio_path, use_cache=not args.no_cache, gate=transcribe_gate
+        )
+    else:
+        with transcribe_gate:
+            transcript = transcribe_with_faster_whisper(
+                audio_path, model_size=args.whisper_model, device=args.whisper_device
+            )
+
+    # Save output
+    _write_episode_json(episode, transcript, args.engine, output_file)
+
+    # Clean up audio unless --keep-audio
+    if not args.keep_audio and audio_path.exists():
+        audio_path.unlink()
+
+    return f"{tag}: saved {output_file}"
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Download and transcribe NYT's The Daily podcast",
@@ -274,6 +697,34 @@ def main() -> None:
         action="store_true",
         help="Keep audio files after transcription (default: delete)",
     )
+    parser.add_argument(
+        "--whisper-model",
+        choices=["tiny", "base", "small", "medium", "large-v3"],
+        default="base",
+        help="faster-whisper model size for --engine whisper (default: base)",
+    )
+    parser.add_argument(
+        "--whisper-device",
+        choices=["auto", "cpu", "cuda"],
+        default="auto",
+        help="Device for faster-whisper (default: auto-detect CUDA)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Transcribe all episodes in a single batched Gemini request",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't reuse cached Gemini uploads; delete uploads after use",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of episodes to process in parallel (default: 4)",
+    )
     args = parser.parse_args()
 
     print(f"Fetching RSS feed from The Daily...")
@@ -288,56 +739,51 @@ def main() -> None:
     out_dir = pathlib.Path(args.output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    for i, episode in enumerate(episodes, 1):
-        print(f"[{i}/{len(episodes)}] {episode.title}")
-        print(f"  Published: {episode.pub_date.strftime('%Y-%m-%d')}")
-        if episode.duration:
-            print(f"  Duration: {episode.duration}")
-
-        safe_name = make_safe_filename(episode.title)
-        audio_path = out_dir / f"{safe_name}.mp3"
-        output_file = out_dir / f"{safe_name}.json"
-
-        # Skip if already processed
-        if output_file.exists():
-            print(f"  Already processed, skipping...")
-            continue
-
-        # Download audio
-        print(f"  Downloading audio...")
-        download_file(episode.audio_url, audio_path)
-        file_size_mb = audio_path.stat().st_size / (1024 * 1024)
-        print(f"  Downloaded {file_size_mb:.1f}MB")
-
-        # Transcribe
-        if args.engine == "gemini":
-            transcript = transcribe_with_gemini(audio_path)
-        else:
-            transcript = transcribe_with_faster_whisper(audio_path)
-
-        # Save output
-        meta = {
-            "title": episode.title,
-            "source": "NYT The Daily",
-            "feed_url": THE_DAILY_RSS,
-            "pub_date": episode.pub_date.isoformat(),
-            "duration": episode.duration,
-            "audio_url": episode.audio_url,
-            "transcription_engine": args.engine,
-            "transcript": transcript,
-        }
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
-
-        print(f"  Saved: {output_file}")
-
-        # Clean up audio unless --keep-audio
-        if not args.keep_audio and audio_path.exists():
-            audio_path.unlink()
-            print("  Deleted audio file")
+    if args.engine == "gemini" and args.batch:
+        # Download everything first, then spend one Gemini request on the lot
+        pending = []
+        for episode in episodes:
+            safe_name = make_safe_filename(episode.title)
+            audio_path = out_dir / f"{safe_name}.mp3"
+            output_file = out_dir / f"{safe_name}.json"
+            if output_file.exists():
+                print(f"{episode.title}: already processed, skipping")
+                continue
+            pending.append((episode, audio_path, output_file))
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                list(pool.map(lambda p: download_file_ranged(p[0].audio_url, p[1]), pending))
+
+            transcripts = transcribe_batch_with_gemini(
+                [audio_path for _, audio_path, _ in pending],
+                use_cache=not args.no_cache,
+            )
+            for (episode, audio_path, output_file), transcript in zip(pending, transcripts):
+                _write_episode_json(episode, transcript, args.engine, output_file)
+                print(f"Saved: {output_file}")
+                if not args.keep_audio and audio_path.exists():
+                    audio_path.unlink()
+
+        print("Done!")
+        return
 
-        print()
+    # Episodes are IO/network-bound, so process them in parallel; the semaphore
+    # keeps at most --concurrency transcriptions in flight against Gemini.
+    transcribe_gate = threading.Semaphore(args.concurrency)
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = {
+            pool.submit(
+                process_episode, episode, i, len(episodes), args, out_dir, transcribe_gate
+            ): episode
+            for i, episode in enumerate(episodes, 1)
+        }
+        for future in as_completed(futures):
+            episode = futures[future]
+            try:
+                print(future.result())
+            except Exception as e:
+                print(f"Failed: {episode.title}: {e}")
 
     print("Done!")
 
@@ -5,29 +5,45 @@ Connects React frontend with the Agentic AI system
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+import re
 import sys
 import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlparse
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from youtube_summarizer import YouTubeSummarizer
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
+# Compiled once at import: matches YouTube hosts including subdomains
+# (m.youtube.com, music.youtube.com) and the no-cookie embed domain
+_YT_HOST_RE = re.compile(r"(?:^|\.)(?:youtube\.com|youtu\.be|youtube-nocookie\.com)$")
+
 # Initialize the summarizer (lazy loading)
 summarizer = None
 
+# Background pool for summarize jobs so the worker thread isn't blocked for
+# the whole download+transcribe+summarize pipeline; clients poll for results
+_JOB_POOL = ThreadPoolExecutor(max_workers=4)
+_JOBS = {}  # job_id -> Future
+
+# Cache for /api/models: the model list changes at most daily, so don't pay
+# a Gemini roundtrip on every request
+_MODELS_CACHE = {'models': None, 'ts': 0.0}
+_MODELS_CACHE_TTL = 3600
+
 def get_summarizer():
     """Lazy load the summarizer to avoid initialization errors"""
     global summarizer
     if summarizer is None:
+        # Imported here so the Gemini SDK doesn't load at Flask startup;
+        # /api/health can respond before any summarize request arrives
+        from youtube_summarizer import YouTubeSummarizer
         summarizer = YouTubeSummarizer()
     return summarizer
 
@@ -41,26 +57,45 @@ def health_check():
     })
 
 
+def _run_summarize_job(url):
+    """Worker-side body of a summarize job. Runs on the background pool."""
+    print(f"🎬 Processing YouTube URL: {url}")
+    summ = get_summarizer()
+    result = summ.process_youtube_url(url)
+
+    # Get memory log
+    memory_log = summ.get_memory_log()
+
+    return {
+        'success': True,
+        'video_id': result.get('video_id', ''),
+        'summary': result.get('summary', ''),
+        'keywords': result.get('keywords', []),
+        'transcript_length': result.get('transcript_length', 0),
+        'segments': result.get('segments', 0),
+        'timestamp': datetime.now().isoformat(),
+        'memory_log': memory_log
+    }
+
+
 @app.route('/api/summarize', methods=['POST'])
 def summarize_video():
     """
-    Summarize a YouTube video
+    Submit a YouTube video for summarization (non-blocking)
 
     Request JSON:
         {
             "url": "https://www.youtube.com/watch?v=..."
         }
 
-    Response JSON:
+    Response JSON (202):
         {
             "success": true,
-            "video_id": "...",
-            "summary": "...",
-            "transcript_length": 12345,
-            "segments": 123,
-            "timestamp": "2025-12-12T10:30:00",
-            "memory_log": [...]
+            "job_id": "...",
+            "status": "pending"
         }
+
+    Poll GET /api/summarize/<job_id> for the result.
     """
     try:
         # Get URL from request
@@ -73,47 +108,89 @@ def summarize_video():
                 'error': 'YouTube URL is required'
             }), 400
 
-        # Validate URL format
-        if 'youtube.com' not in url and 'youtu.be' not in url:
+        # Validate URL format against the actual hostname
+        if not _YT_HOST_RE.search((urlparse(url).hostname or '').lower()):
             return jsonify({
                 'success': False,
                 'error': 'Invalid YouTube URL'
             }), 400
 
-        # Process the video using the agentic AI system
-        print(f"🎬 Processing YouTube URL: {url}")
-        summ = get_summarizer()
-        result = summ.process_youtube_url(url)
+        # Enqueue the job; the pipeline runs on the background pool so this
+        # worker is immediately free for other requests (e.g. /api/health)
+        job_id = uuid.uuid4().hex
+        _JOBS[job_id] = _JOB_POOL.submit(_run_summarize_job, url)
 
-        # Get memory log
-        memory_log = summ.get_memory_log()
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': 'pending'
+        }), 202
 
-        # Format response
-        response = {
+    except Exception as e:
+        print(f"❌ Error processing request: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/summarize/<job_id>', methods=['GET'])
+def get_summarize_result(job_id):
+    """
+    Poll a summarize job
+
+    Response JSON:
+        {"status": "pending"} while running, or the full summary payload
+        (with "status": "completed") once done. Terminal jobs are removed
+        after being reported, so each result is delivered exactly once.
+    """
+    future = _JOBS.get(job_id)
+    if future is None:
+        return jsonify({
+            'success': False,
+            'error': 'Unknown job_id'
+        }), 404
+
+    if not future.done():
+        return jsonify({
             'success': True,
-            'video_id': result.get('video_id', ''),
-            'summary': result.get('summary', ''),
-            'keywords': result.get('keywords', []),
-            'transcript_length': result.get('transcript_length', 0),
-            'segments': result.get('segments', 0),
-            'timestamp': datetime.now().isoformat(),
-            'memory_log': memory_log
-        }
+            'job_id': job_id,
+            'status': 'pending'
+        }), 200
 
-        return jsonify(response), 200
+    # Evict the finished job so the result payload (summary + memory log)
+    # doesn't accumulate for the life of the process
+    _JOBS.pop(job_id, None)
 
+    try:
+        response = future.result()
     except Exception as e:
-        print(f"❌ Error processing request: {str(e)}")
+        print(f"❌ Error processing job {job_id}: {str(e)}")
         return jsonify({
             'success': False,
+            'job_id': job_id,
+            'status': 'failed',
             'error': str(e)
         }), 500
 
+    response = dict(response)
+    response['job_id'] = job_id
+    response['status'] = 'completed'
+    return jsonify(response), 200
+
 
 @app.route('/api/models', methods=['GET'])
 def list_models():
-    """List available Gemini models"""
+    """List available Gemini models (cached; pass ?refresh=1 to force a refetch)"""
     try:
+        refresh = request.args.get('refresh') == '1'
+        if (not refresh and _MODELS_CACHE['models'] is not None
+                and time.time() - _MODELS_CACHE['ts'] < _MODELS_CACHE_TTL):
+            return jsonify({
+                'success': True,
+                'models': _MODELS_CACHE['models']
+            }), 200
+
         import google.generativeai as genai
 
         genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
@@ -129,6 +206,9 @@ def list_models():
             if 'generateContent' in m.supported_generation_methods
         ]
 
+        _MODELS_CACHE['models'] = model_list
+        _MODELS_CACHE['ts'] = time.time()
+
         return jsonify({
             'success': True,
             'models': model_list
@@ -229,11 +309,17 @@ def find_keyword_timestamp():
 
 
 if __name__ == '__main__':
+    from dotenv import load_dotenv
+
+    # Load environment variables
+    load_dotenv()
+
     print("🚀 Starting PodVibe.fm API...")
     print("📡 React frontend should connect to: http://localhost:8000")
     print("🔧 API endpoints available:")
     print("   - GET  /api/health     - Health check")
-    print("   - POST /api/summarize  - Summarize YouTube video")
+    print("   - POST /api/summarize  - Submit YouTube video for summarization")
+    print("   - GET  /api/summarize/<job_id> - Poll summarization result")
     print("   - GET  /api/models     - List available models")
     print("   - GET  /api/trending   - Get trending videos")
     print("\n" + "="*80)
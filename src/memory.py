@@ -4,10 +4,29 @@ Part of the PodVibe.fm Agentic AI System
 """
 
 import json
+import queue
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, asdict
 from typing import List, Dict, Any
 from datetime import datetime
 import os
 
+try:
+    import orjson  # 5-6x faster serialization than stdlib json
+except ImportError:
+    orjson = None
+
+
+@dataclass(slots=True)
+class Entry:
+    """A single memory record; slots keep per-entry overhead low"""
+    session_id: str
+    ts_ns: int
+    event_type: str
+    data: Dict[str, Any]
+
 
 class Memory:
     """
@@ -15,113 +34,141 @@ class Memory:
     Provides observability into the agent's reasoning process.
     """
     
-    def __init__(self, persist_to_file: bool = False, log_file: str = "agent_memory.json"):
+    def __init__(self, persist_to_file: bool = False, log_file: str = "agent_memory.jsonl",
+                 flush_every: int = 50):
         """
         Initialize the memory store
-        
+
         Args:
             persist_to_file: Whether to save memory to disk
             log_file: Path to log file if persisting
+            flush_every: Max entries the writer thread batches per disk write
         """
         self.memory = []
         self.persist_to_file = persist_to_file
         self.log_file = log_file
+        self.flush_every = max(1, flush_every)
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
+        self._fh = None
+        self._q = None
+        # Incremental indexes so summaries/filters don't rescan the whole list
+        self._event_counts = Counter()
+        self._by_type = defaultdict(list)
+
+        if persist_to_file:
+            # Disk writes happen on a daemon thread so log_event is just an
+            # enqueue; the writer drains the queue in batches
+            self._q = queue.Queue(maxsize=10000)
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+
+    def _record(self, event_type: str, data: Dict[str, Any]) -> None:
+        """
+        Build an entry and append it to memory, indexes, and the write queue.
+        Single construction point shared by log_event and the log_* helpers.
+        Takes the data dict as-is so keys like 'event_type' or non-string
+        keys in caller-supplied dicts can't collide with parameters.
+        """
+        # Store a raw nanosecond timestamp; ISO formatting is deferred to the
+        # accessors so the hot logging path skips the string formatting
+        entry = Entry(
+            session_id=self.session_id,
+            ts_ns=time.time_ns(),
+            event_type=event_type,
+            data=data
+        )
+
+        self.memory.append(entry)
+        self._event_counts[event_type] += 1
+        self._by_type[event_type].append(entry)
+
+        if self.persist_to_file:
+            self._q.put(entry)
+
     def log_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """
         Log an event to memory
-        
+
         Args:
             event_type: Type of event (planning, execution, error, result)
             data: Event data dictionary
         """
-        entry = {
-            'session_id': self.session_id,
-            'timestamp': datetime.now().isoformat(),
-            'event_type': event_type,
-            'data': data
-        }
-        
-        self.memory.append(entry)
-        
-        if self.persist_to_file:
-            self._save_to_file()
-    
+        self._record(event_type, data)
+
     def log_plan_creation(self, plan: List[Dict]) -> None:
         """
         Log when a new plan is created
-        
+
         Args:
             plan: The execution plan
         """
-        self.log_event('plan_created', {
+        self._record('plan_created', {
             'total_tasks': len(plan),
             'tasks': [{'step': t['step'], 'action': t['action']} for t in plan]
         })
-    
+
     def log_task_start(self, task: Dict) -> None:
         """
         Log when a task begins execution
-        
+
         Args:
             task: The task being executed
         """
-        self.log_event('task_started', {
+        self._record('task_started', {
             'step': task.get('step'),
             'action': task.get('action'),
             'tool': task.get('tool')
         })
-    
+
     def log_task_completion(self, task: Dict, result: Dict) -> None:
         """
         Log when a task completes successfully
-        
+
         Args:
             task: The completed task
             result: Execution result
         """
-        self.log_event('task_completed', {
+        self._record('task_completed', {
             'step': task.get('step'),
             'action': task.get('action'),
             'status': result.get('status'),
             'result_summary': self._summarize_result(result)
         })
-    
+
     def log_task_failure(self, task: Dict, error: str) -> None:
         """
         Log when a task fails
-        
+
         Args:
             task: The failed task
             error: Error message
         """
-        self.log_event('task_failed', {
+        self._record('task_failed', {
             'step': task.get('step'),
             'action': task.get('action'),
             'error': error
         })
-    
+
     def log_user_input(self, user_input: Dict) -> None:
         """
         Log user input
-        
+
         Args:
             user_input: User's input data
         """
-        self.log_event('user_input', {
+        self._record('user_input', {
             'url': user_input.get('url'),
             'summary_type': user_input.get('summary_type')
         })
-    
+
     def log_final_result(self, result: Dict) -> None:
         """
         Log the final agent output
-        
+
         Args:
             result: Final result dictionary
         """
-        self.log_event('final_result', {
+        self._record('final_result', {
             'video_id': result.get('video_id'),
             'summary_length': len(result.get('summary', '')),
             'transcript_length': len(result.get('transcript', '')),
@@ -139,8 +186,8 @@ class Memory:
             List of memory entries
         """
         if event_type:
-            return [entry for entry in self.memory if entry['event_type'] == event_type]
-        return self.memory
+            return [self._to_public(entry) for entry in self._by_type[event_type]]
+        return [self._to_public(entry) for entry in self.memory]
     
     def get_session_summary(self) -> Dict:
         """
@@ -149,17 +196,12 @@ class Memory:
         Returns:
             Dictionary with session statistics
         """
-        event_counts = {}
-        for entry in self.memory:
-            event_type = entry['event_type']
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
-        
         return {
             'session_id': self.session_id,
             'total_events': len(self.memory),
-            'event_breakdown': event_counts,
-            'start_time': self.memory[0]['timestamp'] if self.memory else None,
-            'end_time': self.memory[-1]['timestamp'] if self.memory else None
+            'event_breakdown': dict(self._event_counts),
+            'start_time': self._fmt_ts(self.memory[0].ts_ns) if self.memory else None,
+            'end_time': self._fmt_ts(self.memory[-1].ts_ns) if self.memory else None
         }
     
     def get_execution_timeline(self) -> List[Dict]:
@@ -170,21 +212,43 @@ class Memory:
             List of execution events in order
         """
         execution_events = ['task_started', 'task_completed', 'task_failed']
+        # Merge the per-type indexes (each already in insertion order) instead
+        # of scanning the full memory list
+        entries = []
+        for event_type in execution_events:
+            entries.extend(self._by_type[event_type])
+        entries.sort(key=lambda entry: entry.ts_ns)
         return [
             {
-                'timestamp': entry['timestamp'],
-                'event': entry['event_type'],
-                'details': entry['data']
+                'timestamp': self._fmt_ts(entry.ts_ns),
+                'event': entry.event_type,
+                'details': entry.data
             }
-            for entry in self.memory
-            if entry['event_type'] in execution_events
+            for entry in entries
         ]
     
     def clear_memory(self) -> None:
         """Clear all memory entries"""
         self.memory = []
+        self._event_counts = Counter()
+        self._by_type = defaultdict(list)
+        self.close()  # Next append opens a log for the new session
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     
+    @staticmethod
+    def _fmt_ts(ns: int) -> str:
+        """Format a nanosecond timestamp as an ISO string"""
+        return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+    def _to_public(self, entry: Entry) -> Dict:
+        """Materialize an entry as a dict with a formatted timestamp"""
+        return {
+            'session_id': entry.session_id,
+            'timestamp': self._fmt_ts(entry.ts_ns),
+            'event_type': entry.event_type,
+            'data': entry.data
+        }
+
     def _summarize_result(self, result: Dict) -> Dict:
         """
         Create a summary of execution result for logging
@@ -211,19 +275,60 @@ class Memory:
         
         return summary
     
-    def _save_to_file(self) -> None:
-        """Save memory to file"""
+    def _dumps(self, obj: Any) -> bytes:
+        """Serialize an object (including Entry dataclasses) to JSON bytes"""
+        if orjson is not None:
+            # orjson serializes dataclasses natively
+            return orjson.dumps(obj)
+        return json.dumps(obj, ensure_ascii=False, default=asdict).encode('utf-8')
+
+    def _writer_loop(self) -> None:
+        """Daemon thread: drain queued entries and write them in batches"""
+        while True:
+            entries = [self._q.get()]
+            while len(entries) < self.flush_every:
+                try:
+                    entries.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(entries)
+            finally:
+                for _ in entries:
+                    self._q.task_done()
+
+    def _write_batch(self, entries: List[Entry]) -> None:
+        """Append a batch of entries to the JSONL log in one write"""
         try:
-            # Create logs directory if it doesn't exist
-            os.makedirs('logs', exist_ok=True)
-            
-            log_path = os.path.join('logs', f"{self.session_id}_{self.log_file}")
-            
-            with open(log_path, 'w', encoding='utf-8') as f:
-                json.dump(self.memory, f, indent=2, ensure_ascii=False)
-        
+            if self._fh is None:
+                # Create logs directory if it doesn't exist
+                os.makedirs('logs', exist_ok=True)
+                log_path = os.path.join('logs', f"{self.session_id}_{self.log_file}")
+                self._fh = open(log_path, 'ab')
+
+            self._fh.write(b''.join(self._dumps(e) + b'\n' for e in entries))
+            self._fh.flush()
+
         except Exception as e:
             print(f"Warning: Failed to save memory to file: {e}")
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written to disk"""
+        # Skip if the daemon writer is gone (e.g. interpreter shutdown)
+        if self._q is not None and self._writer.is_alive():
+            self._q.join()
+
+    def close(self) -> None:
+        """Flush pending entries and close the persistence log file"""
+        self.flush()
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            finally:
+                self._fh = None
+
+    def __del__(self):
+        self.close()
     
     def export_memory(self, filepath: str = None) -> str:
         """
@@ -235,14 +340,22 @@ class Memory:
         Returns:
             Path to exported file
         """
+        self.flush()  # Keep the JSONL log consistent with the export
+
         if not filepath:
             os.makedirs('logs', exist_ok=True)
             filepath = os.path.join('logs', f"memory_export_{self.session_id}.json")
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump({
-                'session_summary': self.get_session_summary(),
-                'memory': self.memory
-            }, f, indent=2, ensure_ascii=False)
-        
+
+        # Stream entry by entry instead of materializing the whole export in
+        # memory first; long sessions only ever hold one serialized entry
+        with open(filepath, 'wb') as f:
+            f.write(b'{"session_summary":')
+            f.write(self._dumps(self.get_session_summary()))
+            f.write(b',"memory":[')
+            for i, entry in enumerate(self.memory):
+                if i:
+                    f.write(b',')
+                f.write(self._dumps(self._to_public(entry)))
+            f.write(b']}')
+
         return filepath
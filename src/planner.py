@@ -3,85 +3,82 @@ Planner Module - Breaks down user goals into sub-tasks
 Part of the PodVibe.fm Agentic AI System
 """
 
+from collections import Counter
 from typing import List, Dict
 from datetime import datetime
 
 
+# Task template for the summarization workflow. Stored once at module level;
+# create_plan clones fresh task dicts from it per request.
+_SUMMARIZE_TEMPLATE = (
+    {
+        'step': 1,
+        'action': 'extract_video_id',
+        'description': 'Parse YouTube URL and extract video ID',
+        'tool': 'url_parser',
+        'status': 'pending'
+    },
+    {
+        'step': 2,
+        'action': 'fetch_transcript',
+        'description': 'Retrieve video transcript from YouTube',
+        'tool': 'youtube_api',
+        'status': 'pending'
+    },
+    {
+        'step': 3,
+        'action': 'generate_summary',
+        'description': 'Generate AI summary using Gemini',
+        'tool': 'gemini_api',
+        'status': 'pending'
+    },
+    {
+        'step': 4,
+        'action': 'extract_keywords',
+        'description': 'Extract 10 semantic keywords from summary',
+        'tool': 'keyword_extractor',
+        'status': 'pending'
+    },
+    {
+        'step': 5,
+        'action': 'store_result',
+        'description': 'Store summary and metadata',
+        'tool': 'memory_store',
+        'status': 'pending'
+    }
+)
+
+
 class Planner:
     """
     Planner component that breaks down the summarization task into discrete sub-tasks.
     Follows the ReAct (Reasoning + Acting) pattern.
     """
-    
+
     def __init__(self):
         """Initialize the planner with task templates"""
-        self.task_templates = {
-            'summarize': [
-                {
-                    'step': 1,
-                    'action': 'extract_video_id',
-                    'description': 'Parse YouTube URL and extract video ID',
-                    'tool': 'url_parser',
-                    'status': 'pending'
-                },
-                {
-                    'step': 2,
-                    'action': 'fetch_transcript',
-                    'description': 'Retrieve video transcript from YouTube',
-                    'tool': 'youtube_api',
-                    'status': 'pending'
-                },
-                {
-                    'step': 3,
-                    'action': 'generate_summary',
-                    'description': 'Generate AI summary using Gemini',
-                    'tool': 'gemini_api',
-                    'status': 'pending'
-                },
-                {
-                    'step': 4,
-                    'action': 'extract_keywords',
-                    'description': 'Extract 10 semantic keywords from summary',
-                    'tool': 'keyword_extractor',
-                    'status': 'pending'
-                },
-                {
-                    'step': 5,
-                    'action': 'store_result',
-                    'description': 'Store summary and metadata',
-                    'tool': 'memory_store',
-                    'status': 'pending'
-                }
-            ]
-        }
-    
+        self.task_templates = {'summarize': _SUMMARIZE_TEMPLATE}
+
     def create_plan(self, user_input: Dict) -> List[Dict]:
         """
         Create an execution plan based on user input
-        
+
         Args:
             user_input: Dictionary containing:
                 - url: YouTube video URL
                 - summary_type: Type of summary requested
-                
+
         Returns:
             List of sub-tasks to execute
         """
-        # For this agent, we use the 'summarize' template
-        plan = self.task_templates['summarize'].copy()
-        
-        # Annotate plan with user context
-        plan_with_context = []
-        for task in plan:
-            task_copy = task.copy()
-            task_copy['context'] = {
-                'url': user_input.get('url'),
-                'summary_type': user_input.get('summary_type', 'comprehensive'),
-                'timestamp': datetime.now().isoformat()
-            }
-            plan_with_context.append(task_copy)
-        
-        return plan_with_context
+        # The context is identical for every task in the plan, so build it once
+        # and share the reference; tasks treat it as read-only.
+        context = {
+            'url': user_input.get('url'),
+            'summary_type': user_input.get('summary_type', 'comprehensive'),
+            'timestamp': datetime.now().isoformat()
+        }
+        return [{**task, 'context': context} for task in _SUMMARIZE_TEMPLATE]
     
     def update_task_status(self, plan: List[Dict], step: int, status: str, result: any = None) -> List[Dict]:
         """
@@ -144,16 +141,15 @@ class Planner:
             Dictionary with plan statistics
         """
         total_tasks = len(plan)
-        completed = sum(1 for task in plan if task['status'] == 'completed')
-        failed = sum(1 for task in plan if task['status'] == 'failed')
-        pending = sum(1 for task in plan if task['status'] == 'pending')
-        in_progress = sum(1 for task in plan if task['status'] == 'in_progress')
-        
+        # One pass over the plan instead of a separate scan per status
+        counts = Counter(task['status'] for task in plan)
+        completed = counts['completed']
+
         return {
             'total_tasks': total_tasks,
             'completed': completed,
-            'failed': failed,
-            'pending': pending,
-            'in_progress': in_progress,
+            'failed': counts['failed'],
+            'pending': counts['pending'],
+            'in_progress': counts['in_progress'],
             'completion_rate': f"{(completed/total_tasks)*100:.1f}%"
         }
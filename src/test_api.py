@@ -1,46 +1,71 @@
 """
 Simple test script to verify the API is working
 """
-import requests
-import json
+import asyncio
+
+import httpx
 
 API_URL = "http://localhost:8000"
 
-print("Testing PodVibe.fm API...\n")
-
-# Test 1: Health Check
-print("1. Testing health endpoint...")
-try:
-    response = requests.get(f"{API_URL}/api/health")
-    print(f"   Status: {response.status_code}")
-    print(f"   Response: {response.json()}")
-    print("   ✅ Health check passed!\n")
-except Exception as e:
-    print(f"   ❌ Error: {e}\n")
-
-# Test 2: Summarize Video
-print("2. Testing summarize endpoint...")
-test_url = "https://www.youtube.com/watch?v=aR20FWCCjAs"
-try:
-    print(f"   Sending request for: {test_url}")
-    response = requests.post(
-        f"{API_URL}/api/summarize",
-        json={"url": test_url},
-        timeout=120  # 2 minutes timeout
-    )
-    print(f"   Status: {response.status_code}")
-    
-    if response.status_code == 200:
-        data = response.json()
-        print(f"   ✅ Summarize successful!")
-        print(f"   Video ID: {data.get('video_id')}")
-        print(f"   Summary length: {len(data.get('summary', ''))} characters")
-        print(f"   Transcript length: {data.get('transcript_length')} characters")
-        print(f"   Segments: {data.get('segments')}")
-        print(f"   Keywords: {', '.join(data.get('keywords', []))}")
-    else:
-        print(f"   ❌ Error: {response.json()}")
-except Exception as e:
-    print(f"   ❌ Error: {e}\n")
-
-print("\nTest complete!")
+
+async def test_health(client):
+    """Test 1: Health Check"""
+    print("1. Testing health endpoint...")
+    try:
+        response = await client.get(f"{API_URL}/api/health")
+        print(f"   Status: {response.status_code}")
+        print(f"   Response: {response.json()}")
+        print("   ✅ Health check passed!\n")
+    except Exception as e:
+        print(f"   ❌ Error: {e}\n")
+
+
+async def test_summarize(client):
+    """Test 2: Summarize Video"""
+    print("2. Testing summarize endpoint...")
+    test_url = "https://www.youtube.com/watch?v=aR20FWCCjAs"
+    try:
+        print(f"   Sending request for: {test_url}")
+        response = await client.post(
+            f"{API_URL}/api/summarize",
+            json={"url": test_url},
+            timeout=30
+        )
+        print(f"   Status: {response.status_code}")
+
+        # Summarization runs in the background; poll the job until it finishes
+        if response.status_code == 202:
+            job_id = response.json().get("job_id")
+            print(f"   Job submitted: {job_id}, polling for result...")
+            deadline = asyncio.get_running_loop().time() + 120  # 2 minutes timeout
+            while asyncio.get_running_loop().time() < deadline:
+                response = await client.get(f"{API_URL}/api/summarize/{job_id}", timeout=30)
+                if response.status_code != 200 or response.json().get("status") != "pending":
+                    break
+                await asyncio.sleep(2)
+
+        if response.status_code == 200 and response.json().get("status") == "completed":
+            data = response.json()
+            print(f"   ✅ Summarize successful!")
+            print(f"   Video ID: {data.get('video_id')}")
+            print(f"   Summary length: {len(data.get('summary', ''))} characters")
+            print(f"   Transcript length: {data.get('transcript_length')} characters")
+            print(f"   Segments: {data.get('segments')}")
+            print(f"   Keywords: {', '.join(data.get('keywords', []))}")
+        else:
+            print(f"   ❌ Error: {response.json()}")
+    except Exception as e:
+        print(f"   ❌ Error: {e}\n")
+
+
+async def main():
+    print("Testing PodVibe.fm API...\n")
+    # One client shares a connection pool across both tests, which run
+    # concurrently instead of waiting on each other
+    async with httpx.AsyncClient() as client:
+        await asyncio.gather(test_health(client), test_summarize(client))
+    print("\nTest complete!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
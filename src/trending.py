@@ -3,39 +3,149 @@ trending videos API - Updated to use YouTube Data API
 More reliable than Gemini Search for finding trending videos
 """
 
-from flask import jsonify
+from flask import jsonify, current_app
 import requests
+from requests.adapters import HTTPAdapter, Retry
+import functools
+import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 import re
 from typing import Optional, Dict, List, Any
 
+try:
+    import orjson  # 5-6x faster serialization than stdlib json
+except ImportError:
+    orjson = None
+
+
+# Non-blocking progress logging: records are enqueued and a background
+# listener writes them out, so the concurrent category workers never
+# serialize on stdout the way print() made them
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _log_queue: "queue.Queue" = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    logger.setLevel(logging.INFO)
+    _log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+
+
+# Shared session so YouTube calls reuse pooled keep-alive connections
+# instead of opening a fresh TCP+TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
 
-_ISO8601_DURATION_RE = re.compile(
-    r"^PT"
-    r"(?:(?P<hours>\d+)H)?"
-    r"(?:(?P<minutes>\d+)M)?"
-    r"(?:(?P<seconds>\d+)S)?"
-    r"$"
-)
 
 _YT_API_DISABLED_REASON: Optional[str] = None
 
+# Read once at import (the module loads after .env is applied); saves the
+# environ lookups every search and route hit repeated
+_YT_API_KEY = os.getenv('YOUTUBE_API_KEY')
+
+# Case-insensitive podcast matcher, compiled once; avoids per-snippet
+# .lower() copies of long descriptions
+_PODCAST_RE = re.compile(r"podcast", re.IGNORECASE)
+
+# Cache of recent search results so repeated /api/trending hits don't burn
+# YouTube quota; maps (query, max_results) -> (fetched_at, videos)
+_SEARCH_CACHE: Dict[Any, Any] = {}
+_SEARCH_CACHE_LOCK = threading.Lock()
+_SEARCH_CACHE_TTL = 600  # seconds
 
+# Route-level cache of the full /api/trending payload; a hit skips the
+# category fan-out (and the thread pool) entirely
+_TRENDING_CACHE: Dict[str, Any] = {'data': None, 'ts': 0.0}
+_TRENDING_TTL = 600  # seconds
+
+# ETags (and the parsed body they validate) from previous YouTube responses,
+# keyed by URL+params; lets refreshes revalidate with If-None-Match and skip
+# re-downloading/parsing identical payloads on a 304
+_ETAG_CACHE: Dict[Any, Any] = {}
+_ETAG_CACHE_LOCK = threading.Lock()
+_ETAG_CACHE_MAX = 64
+
+
+def _get_json(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    GET a YouTube API endpoint and return the parsed JSON body.
+    Sends If-None-Match when a prior ETag is known; a 304 answer reuses the
+    stored body without re-downloading or re-parsing it.
+    """
+    # publishedAfter is formatted from 'now' and differs on every real fetch;
+    # keeping it in the key would mean no two fetches ever share an entry and
+    # If-None-Match would never be sent. The ETag itself still guards
+    # correctness: the server only answers 304 if the body is identical.
+    key = (url, tuple(sorted(
+        item for item in params.items() if item[0] != 'publishedAfter'
+    )))
+    with _ETAG_CACHE_LOCK:
+        cached = _ETAG_CACHE.get(key)
+
+    headers = {'If-None-Match': cached[0]} if cached else None
+    response = _SESSION.get(url, params=params, headers=headers, timeout=10)
+    if cached and response.status_code == 304:
+        return cached[1]
+    response.raise_for_status()
+    # orjson parses the raw bytes several times faster than response.json()
+    data = orjson.loads(response.content) if orjson is not None else response.json()
+
+    etag = response.headers.get('ETag')
+    if etag:
+        with _ETAG_CACHE_LOCK:
+            if key not in _ETAG_CACHE and len(_ETAG_CACHE) >= _ETAG_CACHE_MAX:
+                # Bounded: drop the oldest entry (insertion order)
+                _ETAG_CACHE.pop(next(iter(_ETAG_CACHE)))
+            _ETAG_CACHE[key] = (etag, data)
+    return data
+
+
+# Unit -> (seconds, rank); ranks enforce the H-before-M-before-S order the
+# ISO8601 grammar (and the old regex) required
+_DURATION_UNITS = {"H": (3600, 0), "M": (60, 1), "S": (1, 2)}
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_duration_seconds(iso_duration: str) -> int:
     """
     Parse YouTube ISO8601 duration (e.g., PT1H2M3S) into seconds.
-    Returns 0 if parsing fails.
+    Returns 0 if parsing fails. Memoized: the same duration strings recur
+    across videos and across repeated trending refreshes.
     """
-    if not iso_duration:
-        return 0
-    m = _ISO8601_DURATION_RE.match(iso_duration)
-    if not m:
+    # Single linear scan instead of a regex: accumulate digits, then apply
+    # the H/M/S unit that follows them
+    if not iso_duration or not iso_duration.startswith("PT"):
         return 0
-    hours = int(m.group("hours") or 0)
-    minutes = int(m.group("minutes") or 0)
-    seconds = int(m.group("seconds") or 0)
-    return hours * 3600 + minutes * 60 + seconds
+    total = 0
+    value = 0
+    has_digits = False
+    last_rank = -1
+    for ch in iso_duration[2:]:
+        if "0" <= ch <= "9":
+            value = value * 10 + (ord(ch) - 48)
+            has_digits = True
+        elif has_digits and ch in _DURATION_UNITS:
+            unit_seconds, rank = _DURATION_UNITS[ch]
+            if rank <= last_rank:
+                return 0  # repeated or out-of-order unit (e.g. PT1S2M)
+            total += value * unit_seconds
+            last_rank = rank
+            value = 0
+            has_digits = False
+        else:
+            return 0  # malformed (unknown char or unit without digits)
+    if has_digits:
+        return 0  # trailing digits without a unit
+    return total
 
 
 def _extract_youtube_error_reason(resp: requests.Response) -> Dict[str, str]:
@@ -74,18 +184,30 @@ def _hint_for_youtube_reason(reason: str) -> str:
     return "Open the API key in Google Cloud Console and verify: API enabled, key restrictions, and quota/billing."
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_published_at(published_at: str) -> Optional[datetime]:
     # YouTube returns RFC3339 like "2025-12-12T10:30:00Z"
+    # Memoized (None/empty results included); datetimes are immutable so
+    # sharing the cached instance is safe
+    if not published_at:
+        return None
     try:
-        if not published_at:
-            return None
-        if published_at.endswith("Z"):
-            return datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+        # Python 3.11+ fromisoformat accepts the trailing "Z" directly
         return datetime.fromisoformat(published_at)
+    except Exception:
+        pass
+    try:
+        # Older interpreters need the explicit offset form
+        return datetime.fromisoformat(published_at.replace("Z", "+00:00"))
     except Exception:
         return None
 
 
+# Common English language codes; hit by almost every accepted video, so the
+# set lookup short-circuits the prefix scan
+_EN_CODES = frozenset({"en", "en-us", "en-gb", "en-ca", "en-au", "en-in"})
+
+
 def _is_english(snippet: dict) -> bool:
     """
     Best-effort check that the video is English.
@@ -93,7 +215,8 @@ def _is_english(snippet: dict) -> bool:
     """
     lang = (snippet or {}).get("defaultAudioLanguage") or (snippet or {}).get("defaultLanguage") or ""
     lang = (lang or "").lower()
-    return lang.startswith("en")
+    # startswith fallback keeps rarer variants (en-IE, en-NZ, ...) accepted
+    return lang in _EN_CODES or lang.startswith("en")
 
 
 def _is_podcast_tagged(snippet: dict) -> bool:
@@ -109,25 +232,21 @@ def _is_podcast_tagged(snippet: dict) -> bool:
     if str(snippet.get("categoryId", "")) == "43":
         return True
 
-    haystack = f"{snippet.get('title','')} {snippet.get('description','')}".lower()
-    if "podcast" in haystack or "#podcast" in haystack or "#podcasts" in haystack:
+    # The case-insensitive regex searches each field in place, skipping the
+    # lowercase copy of the (often long) description
+    if _PODCAST_RE.search(snippet.get("title", "")) or _PODCAST_RE.search(snippet.get("description", "")):
         return True
 
     tags = snippet.get("tags") or []
-    for t in tags:
-        if "podcast" in str(t).lower():
-            return True
-    return False
+    return any(_PODCAST_RE.search(str(t)) for t in tags)
 
 
-def _fetch_video_details(video_ids: List[str], api_key: str) -> Dict[str, Dict[str, Any]]:
-    """
-    Fetch contentDetails/snippet for given video ids.
-    Returns a map: videoId -> item
-    """
-    if not video_ids:
-        return {}
+# videos.list accepts at most 50 ids per call
+_DETAILS_BATCH_SIZE = 50
 
+
+def _fetch_video_details_batch(video_ids: List[str], api_key: str) -> Dict[str, Dict[str, Any]]:
+    """Fetch one videos.list batch (<= 50 ids); returns videoId -> item"""
     url = "https://www.googleapis.com/youtube/v3/videos"
     params = {
         "part": "snippet,contentDetails",
@@ -135,15 +254,35 @@ def _fetch_video_details(video_ids: List[str], api_key: str) -> Dict[str, Dict[s
         "key": api_key,
         # "hl" could be set, but not required
     }
-    response = requests.get(url, params=params, timeout=10)
-    response.raise_for_status()
-    data = response.json()
+    data = _get_json(url, params)
 
     out: Dict[str, Dict[str, Any]] = {}
     for item in data.get("items", []):
         out[item.get("id")] = item
     return out
 
+
+def _fetch_video_details(video_ids: List[str], api_key: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch contentDetails/snippet for given video ids.
+    Splits into 50-id batches (the videos.list limit) and fetches multiple
+    batches concurrently. Returns a map: videoId -> item
+    """
+    if not video_ids:
+        return {}
+
+    chunks = [video_ids[i:i + _DETAILS_BATCH_SIZE]
+              for i in range(0, len(video_ids), _DETAILS_BATCH_SIZE)]
+
+    if len(chunks) == 1:
+        return _fetch_video_details_batch(chunks[0], api_key)
+
+    out: Dict[str, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        for batch in pool.map(lambda ids: _fetch_video_details_batch(ids, api_key), chunks):
+            out.update(batch)
+    return out
+
 def search_youtube_videos(query, max_results=3):
     """
     Use YouTube Data API to search for videos
@@ -155,21 +294,38 @@ def search_youtube_videos(query, max_results=3):
     Returns:
         List of video objects
     """
-    api_key = os.getenv('YOUTUBE_API_KEY')
+    return _search_youtube_videos(query, max_results)[0]
+
+
+def _search_youtube_videos(query, max_results=3):
+    """
+    Like search_youtube_videos, but returns (videos, genuine) where genuine
+    is False when the list is sample-data fallback rather than API results,
+    so callers can decide whether the response is worth caching.
+    """
+    api_key = _YT_API_KEY
 
     # Fallback: Use Gemini to generate sample data if no YouTube API key
     if not api_key:
-        return generate_sample_videos(query, max_results)
+        return generate_sample_videos(query, max_results), False
 
     global _YT_API_DISABLED_REASON
     if _YT_API_DISABLED_REASON:
-        print(f"YouTube API is disabled: {_YT_API_DISABLED_REASON}")
+        logger.info(f"YouTube API is disabled: {_YT_API_DISABLED_REASON}")
         # Avoid spamming YouTube with requests once we know it's blocked.
-        return generate_sample_videos(query, max_results)
+        return generate_sample_videos(query, max_results), False
+
+    cache_key = (query, max_results)
+    with _SEARCH_CACHE_LOCK:
+        cached = _SEARCH_CACHE.get(cache_key)
+        if cached and time.time() - cached[0] < _SEARCH_CACHE_TTL:
+            return cached[1], True
 
     try:
-        # Only show recently uploaded: last 14 days
-        published_after = (datetime.now(timezone.utc) - timedelta(days=14)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        # Only show recently uploaded: last 14 days. Computed once and reused
+        # by the filter loop so the cutoff can't drift past the API parameter.
+        two_weeks_ago = datetime.now(timezone.utc) - timedelta(days=14)
+        published_after = two_weeks_ago.strftime('%Y-%m-%dT%H:%M:%SZ')
 
         url = "https://www.googleapis.com/youtube/v3/search"
         # Fetch more than needed so we can filter down to strict constraints:
@@ -190,60 +346,80 @@ def search_youtube_videos(query, max_results=3):
             'relevanceLanguage': 'en'
         }
 
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json(url, params)
 
         search_items = data.get("items", [])
-        video_ids = [it.get("id", {}).get("videoId") for it in search_items if it.get("id", {}).get("videoId")]
-        details_map = _fetch_video_details(video_ids, api_key)
-
-        two_weeks_ago = datetime.now(timezone.utc) - timedelta(days=14)
-        filtered = []
 
+        # Pre-filter on what the search snippet already carries (the podcast
+        # keyword in title/description) so the details call only pays for
+        # real candidates. Language and tags only exist on the full snippet,
+        # so those checks stay after the details fetch. Recency needs no
+        # check at all: publishedAfter already constrained the search.
+        candidates = []
         for it in search_items:
             video_id = it.get("id", {}).get("videoId")
             if not video_id:
                 continue
-
-            details = details_map.get(video_id) or {}
-            snippet = details.get("snippet") or it.get("snippet") or {}
-            content = details.get("contentDetails") or {}
-
-            # Constraints
-            published_at = _parse_published_at(snippet.get("publishedAt"))
-            if not published_at or published_at < two_weeks_ago:
-                continue
-
-            if not _is_english(snippet):
-                continue
-
-            if not _is_podcast_tagged(snippet):
+            search_snippet = it.get("snippet") or {}
+            if not (_PODCAST_RE.search(search_snippet.get("title", ""))
+                    or _PODCAST_RE.search(search_snippet.get("description", ""))):
                 continue
+            candidates.append((video_id, it))
 
-            duration_seconds = _parse_duration_seconds(content.get("duration"))
-            if duration_seconds < 3600:
-                continue
-
-            thumb = (snippet.get("thumbnails") or {}).get("high") or (snippet.get("thumbnails") or {}).get("default") or {}
-            filtered.append({
-                "title": snippet.get("title", ""),
-                "channel": snippet.get("channelTitle", ""),
-                "video_id": video_id,
-                "url": f"https://www.youtube.com/watch?v={video_id}",
-                "thumbnail": thumb.get("url", ""),
-                # Keep description for now; UI may ignore it in compact cards.
-                "description": (snippet.get("description", "")[:150] + "...") if len(snippet.get("description", "")) > 150 else snippet.get("description", ""),
-                # Extra metadata (future use / debugging)
-                "publishedAt": snippet.get("publishedAt"),
-                "durationSeconds": duration_seconds,
-                "defaultAudioLanguage": snippet.get("defaultAudioLanguage") or snippet.get("defaultLanguage"),
-            })
+        filtered = []
 
+        # Candidates are in viewCount order, so fetch details lazily in small
+        # batches and stop once max_results qualify; trailing candidates are
+        # strictly lower-view and never cost a details call
+        batch_size = max(max_results, 1)
+        for start in range(0, len(candidates), batch_size):
             if len(filtered) >= max_results:
                 break
-
-        return filtered
+            batch = candidates[start:start + batch_size]
+            details_map = _fetch_video_details([vid for vid, _ in batch], api_key)
+
+            for video_id, it in batch:
+                details = details_map.get(video_id) or {}
+                snippet = details.get("snippet") or it.get("snippet") or {}
+                content = details.get("contentDetails") or {}
+
+                # Constraints
+                if not _is_english(snippet):
+                    continue
+
+                if not _is_podcast_tagged(snippet):
+                    continue
+
+                duration_seconds = _parse_duration_seconds(content.get("duration"))
+                if duration_seconds < 3600:
+                    continue
+
+                thumbnails = snippet.get("thumbnails") or {}
+                thumb = thumbnails.get("high") or thumbnails.get("default") or {}
+                desc = snippet.get("description", "")
+                filtered.append({
+                    "title": snippet.get("title", ""),
+                    "channel": snippet.get("channelTitle", ""),
+                    "video_id": video_id,
+                    "url": f"https://www.youtube.com/watch?v={video_id}",
+                    "thumbnail": thumb.get("url", ""),
+                    # Keep description for now; UI may ignore it in compact cards.
+                    "description": desc[:150] + "..." if len(desc) > 150 else desc,
+                    # Extra metadata (future use / debugging)
+                    "publishedAt": snippet.get("publishedAt"),
+                    "durationSeconds": duration_seconds,
+                    "defaultAudioLanguage": snippet.get("defaultAudioLanguage") or snippet.get("defaultLanguage"),
+                })
+
+                if len(filtered) >= max_results:
+                    break
+
+        # Only genuine API results are cached; sample-data fallbacks are not,
+        # so a recovered API isn't masked for the TTL window
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE[cache_key] = (time.time(), filtered)
+
+        return filtered, True
 
     except requests.exceptions.HTTPError as e:
         resp = getattr(e, "response", None)
@@ -258,16 +434,196 @@ def search_youtube_videos(query, max_results=3):
             _YT_API_DISABLED_REASON = reason or "forbidden"
 
         hint = _hint_for_youtube_reason(reason)
-        print(
+        logger.error(
             f"YouTube API HTTP error for '{query}': {status} {reason or ''} {message or ''}".strip()
         )
-        print(f"Hint: {hint}")
+        logger.error(f"Hint: {hint}")
         # Fallback to sample data
-        return generate_sample_videos(query, max_results)
+        return generate_sample_videos(query, max_results), False
     except Exception as e:
-        print(f"YouTube API error for '{query}': {str(e)}")
+        logger.error(f"YouTube API error for '{query}': {str(e)}")
         # Fallback to sample data
-        return generate_sample_videos(query, max_results)
+        return generate_sample_videos(query, max_results), False
+
+
+# Sample videos for each category, used when the YouTube API is unavailable.
+# Built once at import; 'days_ago' is resolved to a concrete publishedAt per
+# call so the demo data always looks recently uploaded.
+_SAMPLE_VIDEO_TEMPLATES = {
+    "Latest in AI": [
+        {
+            'title': 'The Future of AI: GPT-5 and Beyond',
+            'channel': 'AI Explained',
+            'video_id': 'dQw4w9WgXcQ',
+            'url': 'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'thumbnail': 'https://img.youtube.com/vi/dQw4w9WgXcQ/hqdefault.jpg',
+            'description': 'Podcast episode: Deep dive into the latest AI developments and what GPT-5 might bring to the table.',
+            # match strict filters (best-effort demo)
+            'days_ago': 3,
+            'durationSeconds': 3900,
+            'defaultAudioLanguage': 'en'
+        },
+        {
+            'title': 'AI Safety: Why It Matters Now More Than Ever',
+            'channel': 'Tech Future Podcast',
+            'video_id': 'oHg5SJYRHA0',
+            'url': 'https://www.youtube.com/watch?v=oHg5SJYRHA0',
+            'thumbnail': 'https://img.youtube.com/vi/oHg5SJYRHA0/hqdefault.jpg',
+            'description': 'Podcast episode: Exploring the critical importance of AI safety research and alignment.',
+            'days_ago': 5,
+            'durationSeconds': 4200,
+            'defaultAudioLanguage': 'en'
+        },
+        {
+            'title': 'Machine Learning Breakthroughs in 2024',
+            'channel': 'ML Weekly',
+            'video_id': 'jNQXAC9IVRw',
+            'url': 'https://www.youtube.com/watch?v=jNQXAC9IVRw',
+            'thumbnail': 'https://img.youtube.com/vi/jNQXAC9IVRw/hqdefault.jpg',
+            'description': 'Podcast episode: A roundup of the most significant machine learning breakthroughs this year.',
+            'days_ago': 9,
+            'durationSeconds': 3600,
+            'defaultAudioLanguage': 'en'
+        }
+    ],
+    "Tech News": [
+        {
+            'title': 'Apple Vision Pro: 6 Months Later',
+            'channel': 'Tech Review Daily',
+            'video_id': 'yPYZpwSpKmA',
+            'url': 'https://www.youtube.com/watch?v=yPYZpwSpKmA',
+            'thumbnail': 'https://img.youtube.com/vi/yPYZpwSpKmA/hqdefault.jpg',
+            'description': 'Podcast episode: A comprehensive review after using Vision Pro for six months in real-world scenarios.',
+            'days_ago': 2,
+            'durationSeconds': 3700,
+            'defaultAudioLanguage': 'en'
+        },
+        {
+            'title': 'The State of Tech in 2025',
+            'channel': 'Tech Trends',
+            'video_id': '9bZkp7q19f0',
+            'url': 'https://www.youtube.com/watch?v=9bZkp7q19f0',
+            'thumbnail': 'https://img.youtube.com/vi/9bZkp7q19f0/hqdefault.jpg',
+            'description': 'Podcast episode: Breaking down the biggest tech trends and what to expect in the coming year.',
+            'days_ago': 7,
+            'durationSeconds': 5400,
+            'defaultAudioLanguage': 'en'
+        },
+        {
+            'title': 'Silicon Valley Startup Scene Update',
+            'channel': 'Startup Stories',
+            'video_id': 'pRpeEdMmmQ0',
+            'url': 'https://www.youtube.com/watch?v=pRpeEdMmmQ0',
+            'thumbnail': 'https://img.youtube.com/vi/pRpeEdMmmQ0/hqdefault.jpg',
+            'description': 'Podcast episode: Latest news from Silicon Valley startups and venture capital trends.',
+            'days_ago': 12,
+            'durationSeconds': 4000,
+            'defaultAudioLanguage': 'en'
+        }
+    ],
+    "Movies": [
+        {
+            'title': 'Top Movies of 2024: A Retrospective',
+            'channel': 'Cinema Podcast',
+            'video_id': 'kJQP7kiw5Fk',
+            'url': 'https://www.youtube.com/watch?v=kJQP7kiw5Fk',
+            'thumbnail': 'https://img.youtube.com/vi/kJQP7kiw5Fk/hqdefault.jpg',
+            'description': 'Podcast episode: Reviewing the best films of 2024 and what made them special.',
+            'days_ago': 4,
+            'durationSeconds': 3900,
+            'defaultAudioLanguage': 'en'
+        },
+        {
+            'title': 'Oscars 2025: Predictions and Analysis',
+            'channel': 'Film Critics Roundtable',
+            'video_id': 'lDK9QqIzhwk',
+            'url': 'https://www.youtube.com/watch?v=lDK9QqIzhwk',
+            'thumbnail': 'https://img.youtube.com/vi/lDK9QqIzhwk/hqdefault.jpg',
+            'description': 'Podcast episode: Expert predictions for this year\'s Academy Awards and dark horse candidates.',
+            'days_ago': 10,
+            'durationSeconds': 4200,
+            'defaultAudioLanguage': 'en'
+        },
+        {
+            'title': 'Behind the Scenes: Modern Filmmaking',
+            'channel': 'Movie Insider',
+            'video_id': 'CevxZvSJLk8',
+            'url': 'https://www.youtube.com/watch?v=CevxZvSJLk8',
+            'thumbnail': 'https://img.youtube.com/vi/CevxZvSJLk8/hqdefault.jpg',
+            'description': 'Podcast episode: How technology is changing the way movies are made in Hollywood.',
+            'days_ago': 1,
+            'durationSeconds': 3900,
+            'defaultAudioLanguage': 'en'
+        }
+    ],
+    "Politics": [
+        {
+            'title': '2024 Election Analysis: What It Means',
+            'channel': 'Political Roundtable',
+            'video_id': 'kffacxfA7G4',
+            'url': 'https://www.youtube.com/watch?v=kffacxfA7G4',
+            'thumbnail': 'https://img.youtube.com/vi/kffacxfA7G4/hqdefault.jpg',
+            'description': 'Podcast episode: Expert analysis of the election results and implications for policy.',
+            'days_ago': 6,
+            'durationSeconds': 4100,
+            'defaultAudioLanguage': 'en'
+        },
+        {
+            'title': 'Understanding Modern Political Movements',
+            'channel': 'Policy Podcast',
+            'video_id': 'fJ9rUzIMcZQ',
+            'url': 'https://www.youtube.com/watch?v=fJ9rUzIMcZQ',
+            'thumbnail': 'https://img.youtube.com/vi/fJ9rUzIMcZQ/hqdefault.jpg',
+            'description': 'Podcast episode: Deep dive into the grassroots movements shaping politics today.',
+            'days_ago': 8,
+            'durationSeconds': 3605,
+            'defaultAudioLanguage': 'en'
+        },
+        {
+            'title': 'Climate Policy: Progress and Challenges',
+            'channel': 'The Policy Show',
+            'video_id': 'WPni755-Krg',
+            'url': 'https://www.youtube.com/watch?v=WPni755-Krg',
+            'thumbnail': 'https://img.youtube.com/vi/WPni755-Krg/hqdefault.jpg',
+            'description': 'Podcast episode: Examining recent climate legislation and what still needs to be done.',
+            'days_ago': 11,
+            'durationSeconds': 4800,
+            'defaultAudioLanguage': 'en'
+        }
+    ]
+}
+
+
+# Lowercased category names paired with their templates, computed once so
+# lookups don't re-lower every category name per call
+_SAMPLE_LOOKUP = [(name.lower(), templates) for name, templates in _SAMPLE_VIDEO_TEMPLATES.items()]
+
+# Rendered samples, rebuilt at most hourly so publishedAt stays plausibly
+# recent without re-rendering 12 videos on every call
+_SAMPLES_CACHE: Dict[str, Any] = {'built_at': 0.0, 'by_category': {}}
+_SAMPLES_REFRESH = 3600  # seconds
+
+
+def _render_sample_videos(templates: List[Dict], now: datetime) -> List[Dict]:
+    """Materialize sample templates with publishedAt relative to 'now'"""
+    videos = []
+    for tpl in templates:
+        video = {k: v for k, v in tpl.items() if k != 'days_ago'}
+        video['publishedAt'] = (now - timedelta(days=tpl['days_ago'])).isoformat()
+        videos.append(video)
+    return videos
+
+
+def _rendered_samples() -> Dict[str, List[Dict]]:
+    """Return the lowercase-category -> rendered-videos map, refreshing hourly"""
+    if time.time() - _SAMPLES_CACHE['built_at'] > _SAMPLES_REFRESH:
+        now = datetime.now(timezone.utc)
+        _SAMPLES_CACHE['by_category'] = {
+            name_lower: _render_sample_videos(templates, now)
+            for name_lower, templates in _SAMPLE_LOOKUP
+        }
+        _SAMPLES_CACHE['built_at'] = time.time()
+    return _SAMPLES_CACHE['by_category']
 
 
 def generate_sample_videos(query, count=3):
@@ -275,159 +631,31 @@ def generate_sample_videos(query, count=3):
     Generate sample video data when YouTube API is not available
     This provides a working demo even without API keys
     """
-    # Map of sample videos for each category
-    print(f"Generating sample videos for '{query}'")
-    samples = {
-        "Latest in AI": [
-            {
-                'title': 'The Future of AI: GPT-5 and Beyond',
-                'channel': 'AI Explained',
-                'video_id': 'dQw4w9WgXcQ',
-                'url': 'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
-                'thumbnail': 'https://img.youtube.com/vi/dQw4w9WgXcQ/hqdefault.jpg',
-                'description': 'Podcast episode: Deep dive into the latest AI developments and what GPT-5 might bring to the table.',
-                # match strict filters (best-effort demo)
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=3)).isoformat(),
-                'durationSeconds': 3900,
-                'defaultAudioLanguage': 'en'
-            },
-            {
-                'title': 'AI Safety: Why It Matters Now More Than Ever',
-                'channel': 'Tech Future Podcast',
-                'video_id': 'oHg5SJYRHA0',
-                'url': 'https://www.youtube.com/watch?v=oHg5SJYRHA0',
-                'thumbnail': 'https://img.youtube.com/vi/oHg5SJYRHA0/hqdefault.jpg',
-                'description': 'Podcast episode: Exploring the critical importance of AI safety research and alignment.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=5)).isoformat(),
-                'durationSeconds': 4200,
-                'defaultAudioLanguage': 'en'
-            },
-            {
-                'title': 'Machine Learning Breakthroughs in 2024',
-                'channel': 'ML Weekly',
-                'video_id': 'jNQXAC9IVRw',
-                'url': 'https://www.youtube.com/watch?v=jNQXAC9IVRw',
-                'thumbnail': 'https://img.youtube.com/vi/jNQXAC9IVRw/hqdefault.jpg',
-                'description': 'Podcast episode: A roundup of the most significant machine learning breakthroughs this year.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=9)).isoformat(),
-                'durationSeconds': 3600,
-                'defaultAudioLanguage': 'en'
-            }
-        ],
-        "Tech News": [
-            {
-                'title': 'Apple Vision Pro: 6 Months Later',
-                'channel': 'Tech Review Daily',
-                'video_id': 'yPYZpwSpKmA',
-                'url': 'https://www.youtube.com/watch?v=yPYZpwSpKmA',
-                'thumbnail': 'https://img.youtube.com/vi/yPYZpwSpKmA/hqdefault.jpg',
-                'description': 'Podcast episode: A comprehensive review after using Vision Pro for six months in real-world scenarios.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=2)).isoformat(),
-                'durationSeconds': 3700,
-                'defaultAudioLanguage': 'en'
-            },
-            {
-                'title': 'The State of Tech in 2025',
-                'channel': 'Tech Trends',
-                'video_id': '9bZkp7q19f0',
-                'url': 'https://www.youtube.com/watch?v=9bZkp7q19f0',
-                'thumbnail': 'https://img.youtube.com/vi/9bZkp7q19f0/hqdefault.jpg',
-                'description': 'Podcast episode: Breaking down the biggest tech trends and what to expect in the coming year.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=7)).isoformat(),
-                'durationSeconds': 5400,
-                'defaultAudioLanguage': 'en'
-            },
-            {
-                'title': 'Silicon Valley Startup Scene Update',
-                'channel': 'Startup Stories',
-                'video_id': 'pRpeEdMmmQ0',
-                'url': 'https://www.youtube.com/watch?v=pRpeEdMmmQ0',
-                'thumbnail': 'https://img.youtube.com/vi/pRpeEdMmmQ0/hqdefault.jpg',
-                'description': 'Podcast episode: Latest news from Silicon Valley startups and venture capital trends.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=12)).isoformat(),
-                'durationSeconds': 4000,
-                'defaultAudioLanguage': 'en'
-            }
-        ],
-        "Movies": [
-            {
-                'title': 'Top Movies of 2024: A Retrospective',
-                'channel': 'Cinema Podcast',
-                'video_id': 'kJQP7kiw5Fk',
-                'url': 'https://www.youtube.com/watch?v=kJQP7kiw5Fk',
-                'thumbnail': 'https://img.youtube.com/vi/kJQP7kiw5Fk/hqdefault.jpg',
-                'description': 'Podcast episode: Reviewing the best films of 2024 and what made them special.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=4)).isoformat(),
-                'durationSeconds': 3900,
-                'defaultAudioLanguage': 'en'
-            },
-            {
-                'title': 'Oscars 2025: Predictions and Analysis',
-                'channel': 'Film Critics Roundtable',
-                'video_id': 'lDK9QqIzhwk',
-                'url': 'https://www.youtube.com/watch?v=lDK9QqIzhwk',
-                'thumbnail': 'https://img.youtube.com/vi/lDK9QqIzhwk/hqdefault.jpg',
-                'description': 'Podcast episode: Expert predictions for this year\'s Academy Awards and dark horse candidates.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=10)).isoformat(),
-                'durationSeconds': 4200,
-                'defaultAudioLanguage': 'en'
-            },
-            {
-                'title': 'Behind the Scenes: Modern Filmmaking',
-                'channel': 'Movie Insider',
-                'video_id': 'CevxZvSJLk8',
-                'url': 'https://www.youtube.com/watch?v=CevxZvSJLk8',
-                'thumbnail': 'https://img.youtube.com/vi/CevxZvSJLk8/hqdefault.jpg',
-                'description': 'Podcast episode: How technology is changing the way movies are made in Hollywood.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=1)).isoformat(),
-                'durationSeconds': 3900,
-                'defaultAudioLanguage': 'en'
-            }
-        ],
-        "Politics": [
-            {
-                'title': '2024 Election Analysis: What It Means',
-                'channel': 'Political Roundtable',
-                'video_id': 'kffacxfA7G4',
-                'url': 'https://www.youtube.com/watch?v=kffacxfA7G4',
-                'thumbnail': 'https://img.youtube.com/vi/kffacxfA7G4/hqdefault.jpg',
-                'description': 'Podcast episode: Expert analysis of the election results and implications for policy.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=6)).isoformat(),
-                'durationSeconds': 4100,
-                'defaultAudioLanguage': 'en'
-            },
-            {
-                'title': 'Understanding Modern Political Movements',
-                'channel': 'Policy Podcast',
-                'video_id': 'fJ9rUzIMcZQ',
-                'url': 'https://www.youtube.com/watch?v=fJ9rUzIMcZQ',
-                'thumbnail': 'https://img.youtube.com/vi/fJ9rUzIMcZQ/hqdefault.jpg',
-                'description': 'Podcast episode: Deep dive into the grassroots movements shaping politics today.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=8)).isoformat(),
-                'durationSeconds': 3605,
-                'defaultAudioLanguage': 'en'
-            },
-            {
-                'title': 'Climate Policy: Progress and Challenges',
-                'channel': 'The Policy Show',
-                'video_id': 'WPni755-Krg',
-                'url': 'https://www.youtube.com/watch?v=WPni755-Krg',
-                'thumbnail': 'https://img.youtube.com/vi/WPni755-Krg/hqdefault.jpg',
-                'description': 'Podcast episode: Examining recent climate legislation and what still needs to be done.',
-                'publishedAt': (datetime.now(timezone.utc) - timedelta(days=11)).isoformat(),
-                'durationSeconds': 4800,
-                'defaultAudioLanguage': 'en'
-            }
-        ]
-    }
+    logger.info(f"Generating sample videos for '{query}'")
+
+    by_category = _rendered_samples()
+    query_lower = query.lower()
+
+    # The route passes category names verbatim, so the exact-match dict hit
+    # is the common case; the substring scan covers free-form queries
+    videos = by_category.get(query_lower)
+    if videos is None:
+        for category_lower, rendered in by_category.items():
+            if category_lower in query_lower:
+                videos = rendered
+                break
+        else:
+            # Default fallback
+            videos = by_category["latest in ai"]
+
+    return videos[:count]
 
-    # Return sample videos for the query
-    for category, videos in samples.items():
-        if category.lower() in query.lower():
-            return videos[:count]
 
-    # Default fallback
-    return samples.get("Latest in AI", [])[:count]
+def _json_response(payload: Dict, status: int = 200):
+    """Serialize a response with orjson when available (jsonify otherwise)"""
+    if orjson is not None:
+        return current_app.response_class(orjson.dumps(payload), mimetype='application/json'), status
+    return jsonify(payload), status
 
 
 def get_trending_podcasts_route():
@@ -436,6 +664,9 @@ def get_trending_podcasts_route():
     Returns trending videos for all categories
     """
     try:
+        if _TRENDING_CACHE['data'] is not None and time.time() - _TRENDING_CACHE['ts'] < _TRENDING_TTL:
+            return _json_response(_TRENDING_CACHE['data'])
+
         categories = [
             {"id": "ai", "name": "Latest in AI", "icon": "🤖"},
             {"id": "tech", "name": "Tech News", "icon": "💻"},
@@ -446,35 +677,48 @@ def get_trending_podcasts_route():
         results = {}
 
         # Check if YouTube API key is available
-        has_youtube_api = bool(os.getenv('YOUTUBE_API_KEY'))
+        has_youtube_api = bool(_YT_API_KEY)
 
         if not has_youtube_api:
-            print("⚠️  No YOUTUBE_API_KEY found - using sample data")
-
-        for category in categories:
-            print(f"🔍 Searching trending videos for: {category['name']}")
-            videos = search_youtube_videos(category['name'], max_results=3)
-
+            logger.warning("⚠️  No YOUTUBE_API_KEY found - using sample data")
+
+        # The four category searches are independent network calls, so run
+        # them concurrently instead of paying four round-trips in sequence
+        logger.info(f"🔍 Searching trending videos for: {', '.join(c['name'] for c in categories)}")
+        with ThreadPoolExecutor(max_workers=len(categories)) as pool:
+            searches = list(pool.map(
+                lambda c: _search_youtube_videos(c['name'], max_results=3),
+                categories
+            ))
+
+        all_genuine = True
+        for category, (videos, genuine) in zip(categories, searches):
             results[category['id']] = {
                 'name': category['name'],
                 'icon': category['icon'],
                 'videos': videos
             }
+            all_genuine = all_genuine and genuine
+            logger.info(f"✅ Found {len(videos)} videos for {category['name']}")
 
-            print(f"✅ Found {len(videos)} videos for {category['name']}")
-
-        return jsonify({
+        payload = {
             'success': True,
             'categories': results,
             'timestamp': datetime.now().isoformat(),
             'using_sample_data': not has_youtube_api
-        }), 200
+        }
+        # Don't cache sample-data fallbacks while a key is configured, so a
+        # recovered API isn't masked for the TTL window (mirrors the search
+        # cache). With no key, samples are the real behavior — cache them.
+        if all_genuine or not has_youtube_api:
+            _TRENDING_CACHE['data'] = payload
+            _TRENDING_CACHE['ts'] = time.time()
+
+        return _json_response(payload)
 
     except Exception as e:
-        print(f"❌ Error getting trending videos: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({
+        logger.exception(f"❌ Error getting trending videos: {str(e)}")
+        return _json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)